@@ -264,6 +264,8 @@ public enum ChunkingStrategy: String, CaseIterable {
 ///   - firstTokenLogProbThreshold: If the log probability over the first sampled token is below this value, treat as failed.
 ///   - noSpeechThreshold: If the no speech probability is higher than this value AND the average log
 ///                        probability over sampled tokens is below `logProbThreshold`, consider the segment as silent.
+///   - scheduleLongestFirst: When transcribing multiple audio inputs with a non-zero `concurrentWorkerCount`, start the longest inputs first
+///                           so each batch holds inputs of similar length. Results are still returned in input order.
 @available(macOS 13, iOS 16, watchOS 10, visionOS 1, *)
 public struct DecodingOptions {
     public var verbose: Bool
@@ -292,6 +294,7 @@ public struct DecodingOptions {
     public var noSpeechThreshold: Float?
     public var concurrentWorkerCount: Int
     public var chunkingStrategy: ChunkingStrategy?
+    public var scheduleLongestFirst: Bool
 
     public init(
         verbose: Bool = false,
@@ -319,7 +322,8 @@ public struct DecodingOptions {
         firstTokenLogProbThreshold: Float? = -1.5,
         noSpeechThreshold: Float? = 0.6,
         concurrentWorkerCount: Int = 0,
-        chunkingStrategy: ChunkingStrategy? = nil
+        chunkingStrategy: ChunkingStrategy? = nil,
+        scheduleLongestFirst: Bool = false
     ) {
         self.verbose = verbose
         self.task = task
@@ -347,6 +351,7 @@ public struct DecodingOptions {
         self.noSpeechThreshold = noSpeechThreshold
         self.concurrentWorkerCount = concurrentWorkerCount
         self.chunkingStrategy = chunkingStrategy
+        self.scheduleLongestFirst = scheduleLongestFirst
     }
 }
 
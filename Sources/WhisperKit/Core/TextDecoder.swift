@@ -586,6 +586,10 @@ open class TextDecoder: TextDecoding, WhisperMLModel {
 
         let loopCount = min(options.sampleLength, Constants.maxTokenContext - 1)
         Logging.debug("Running main loop for a maximum of \(loopCount) iterations, starting at index \(prefilledIndex)")
+
+        // Per-token debug messages decode text, so only build them when they will be logged
+        let isDebugLogging = Logging.shared.logLevel.shouldLog(level: .debug)
+
         var hasAlignment = false
         var isFirstTokenLogProbTooLow = false
         let windowUUID = UUID()
@@ -599,7 +603,9 @@ open class TextDecoder: TextDecoding, WhisperMLModel {
             // Check if current index is part of the initial prompt
             if tokenIndex < intialPromptIndex {
                 nextToken = currentTokens[tokenIndex]
-                Logging.debug("Forcing prompt tokenIndex: \(tokenIndex), token: \(nextToken), text: \(tokenizer.decode(tokens: [nextToken]))")
+                if isDebugLogging {
+                    Logging.debug("Forcing prompt tokenIndex: \(tokenIndex), token: \(nextToken), text: \(tokenizer.decode(tokens: [nextToken]))")
+                }
             }
 
             // Set the current token as model input
@@ -654,7 +660,9 @@ open class TextDecoder: TextDecoding, WhisperMLModel {
             nextToken = sampleResult.tokens.last!
             let nextTokenLogProb = sampleResult.logProbs.last!
 
-            Logging.debug("Predicted next tokenIndex: \(tokenIndex + 1), token: \(nextToken), text: \(tokenizer.decode(tokens: [nextToken]))")
+            if isDebugLogging {
+                Logging.debug("Predicted next tokenIndex: \(tokenIndex + 1), token: \(nextToken), text: \(tokenizer.decode(tokens: [nextToken]))")
+            }
 
             let samplingTime = Date().timeIntervalSince(samplingStartTime)
             timings.decodingSampling += samplingTime
@@ -157,6 +157,9 @@ extension Float {
 }
 
 extension String {
+    /// Compiled once instead of on every `normalized` call
+    private static let multipleSpacesRegex = try! NSRegularExpression(pattern: " +")
+
     var normalized: String {
         // Trim whitespace and newlines
         let trimmedString = self.trimmingCharacters(in: .whitespacesAndNewlines)
@@ -170,8 +173,12 @@ extension String {
         // Remove punctuation
         let noPunctuationString = noDashesString.components(separatedBy: .punctuationCharacters).joined()
 
-        // Replace multiple spaces with a single space
-        let singleSpacedString = noPunctuationString.replacingOccurrences(of: " +", with: " ", options: .regularExpression)
+        // Replace multiple spaces with a single space, skipping the regex when there is nothing to collapse
+        guard noPunctuationString.contains("  ") else {
+            return noPunctuationString
+        }
+        let fullRange = NSRange(noPunctuationString.startIndex..., in: noPunctuationString)
+        let singleSpacedString = String.multipleSpacesRegex.stringByReplacingMatches(in: noPunctuationString, range: fullRange, withTemplate: " ")
 
         return singleSpacedString
     }
@@ -532,6 +532,9 @@ open class WhisperKit {
     /// specified in `decodeOptions`, if any. The transcription is performed concurrently on these chunks, and the results
     /// are aggregated and returned in the original order.
     ///
+    /// Batches are formed in input order by default. When `decodeOptions.scheduleLongestFirst` is set, the longest audio
+    /// arrays are batched first instead, so each batch holds arrays of similar length and no long array starts last.
+    ///
     /// - Parameters:
     ///   - audioArrays: An array of arrays, each containing audio sample data to be transcribed.
     ///   - decodeOptions: Optional decoding options to customize the transcription process.
@@ -564,7 +567,7 @@ open class WhisperKit {
         decodeOptionsArray: [DecodingOptions?] = [nil],
         callback: TranscriptionCallback = nil
     ) async -> [Result<[TranscriptionResult], Swift.Error>] {
-        var result = [Result<[TranscriptionResult], Swift.Error>]()
+        var result = [(index: Int, result: Result<[TranscriptionResult], Swift.Error>)]()
 
         guard audioArrays.count == decodeOptionsArray.count else {
             return [.failure(WhisperError.transcriptionFailed("The number of audio arrays and decoding options must be balanced."))]
@@ -573,22 +576,30 @@ open class WhisperKit {
         // Determine the number of concurrent workers from decodeOptions based on the maximum value or default to 0
         let concurrentWorkerCount = decodeOptionsArray.map { $0?.concurrentWorkerCount ?? 0 }.max() ?? 0
 
-        // Chunk the audio arrays based on the number of concurrent workers
+        // Optionally process the longest audio first, so each batch holds inputs of similar length
+        // and a long input never starts last while the other workers sit idle
+        let scheduleLongestFirst = decodeOptionsArray.contains { $0?.scheduleLongestFirst ?? false }
+        let processingOrder = scheduleLongestFirst
+            ? audioArrays.indices.sorted { audioArrays[$0].count > audioArrays[$1].count }
+            : Array(audioArrays.indices)
+
+        // Chunk the audio indices based on the number of concurrent workers
         // If concurrentWorkerCount is 0, all audio arrays are processed in one batch
-        let batchedAudioArrays = concurrentWorkerCount == 0 ? [audioArrays] : audioArrays.batched(into: concurrentWorkerCount)
+        let batchedAudioIndices = concurrentWorkerCount == 0 ? [processingOrder] : processingOrder.batched(into: concurrentWorkerCount)
 
-        for (batchIndex, audioArrayBatch) in batchedAudioArrays.enumerated() {
+        for audioIndexBatch in batchedAudioIndices {
             // Use withTaskGroup to manage concurrent transcription tasks
-            let partialResult = await withTaskGroup(of: [(index: Int, result: Result<[TranscriptionResult], Swift.Error>)].self) { taskGroup -> [Result<[TranscriptionResult], Swift.Error>] in
-                for (audioIndex, audioArray) in audioArrayBatch.enumerated() {
+            let partialResult = await withTaskGroup(of: [(index: Int, result: Result<[TranscriptionResult], Swift.Error>)].self) { taskGroup -> [(index: Int, result: Result<[TranscriptionResult], Swift.Error>)] in
+                for audioIndex in audioIndexBatch {
                     // Setup callback to keep track of batches and chunks
                     let batchedAudioCallback: ((TranscriptionProgress) -> Bool?) = { progress in
                         var batchedProgress = progress
-                        batchedProgress.windowId = audioIndex + batchIndex * audioArrayBatch.count
+                        batchedProgress.windowId = audioIndex
                         return callback?(batchedProgress)
                     }
 
-                    // Setup decoding options for the current audio array
+                    // Setup audio and decoding options for the current audio array
+                    let audioArray = audioArrays[audioIndex]
                     let batchedDecodeOptions = decodeOptionsArray[audioIndex]
 
                     // Add a new task to the task group for each audio array
@@ -613,18 +624,18 @@ open class WhisperKit {
                 for await result in taskGroup {
                     batchResult.append(contentsOf: result)
                 }
-
-                // Sort the results by index to maintain the original order (they may not be in order due to concurrency)
-                batchResult.sort(by: { $0.index < $1.index })
-
-                // Map the sorted batch results to a simple array of results
-                return batchResult.map { $0.result }
+                return batchResult
             }
 
             // Append the results of each batch to the final result array
             result.append(contentsOf: partialResult)
         }
-        return result
+
+        // Sort the results by index to restore the original order (they may not be in order due to concurrency and length ordering)
+        result.sort(by: { $0.index < $1.index })
+
+        // Map the sorted results to a simple array of results
+        return result.map { $0.result }
     }
 
     // MARK: - Transcribe single audio file
@@ -715,6 +726,8 @@ open class WhisperKit {
                 // Reset the seek times since we've already chunked the audio
                 var chunkedOptions = decodeOptions
                 chunkedOptions?.clipTimestamps = []
+                // Keep the chunks of a single audio array in time order
+                chunkedOptions?.scheduleLongestFirst = false
                 let chunkedDecodeOptions = Array(repeating: chunkedOptions, count: audioChunks.count)
 
                 // Send chunked samples to transcribe (note: this is recursive)
@@ -106,6 +106,9 @@ struct CLIArguments: ParsableArguments {
     @Option(help: "Maximum concurrent inference, might be helpful when processing more than 1 audio file at the same time. 0 means unlimited")
     var concurrentWorkerCount: Int = 0
 
+    @Flag(help: "Transcribe the longest audio files first when using a concurrent worker count, results keep the input order")
+    var lptOrder: Bool = false
+
     @Option(help: "Chunking strategy for audio processing, `nil` means no chunking, `vad` means using voice activity detection")
     var chunkingStrategy: String? = nil
 }
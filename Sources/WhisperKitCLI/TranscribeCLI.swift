@@ -16,6 +16,9 @@ struct TranscribeCLI: AsyncParsableCommand {
     @OptionGroup
     var cliArguments: CLIArguments
 
+    /// File extensions picked up when scanning `--audio-folder`
+    private static let audioExtensions: Set<String> = ["mp3", "wav", "m4a", "flac", "aiff", "aac"]
+
     mutating func validate() throws {
         if let language = cliArguments.language {
             if !Constants.languages.values.contains(language) {
@@ -28,14 +31,12 @@ struct TranscribeCLI: AsyncParsableCommand {
                 throw ValidationError("Either audioPath or audioFolder must be provided.")
             }
             let fileManager = FileManager.default
-            let audioExtensions = ["mp3", "wav", "m4a", "flac", "aiff", "aac"]
             let audioFiles = try fileManager.contentsOfDirectory(atPath: audioFolder)
                 .filter { fileName in
-                    let fileExtension = fileName.lowercased().components(separatedBy: ".").last
-                    return audioExtensions.contains(fileExtension ?? "")
+                    Self.audioExtensions.contains(NSString(string: fileName).pathExtension.lowercased())
                 }
 
-            cliArguments.audioPath = audioFiles.map { audioFolder + "/" + $0 }
+            cliArguments.audioPath = audioFiles.sorted().map { audioFolder + "/" + $0 }
         }
 
         if let chunkingStrategyRaw = cliArguments.chunkingStrategy {
@@ -151,14 +152,12 @@ struct TranscribeCLI: AsyncParsableCommand {
                 return
             }
             // TODO: Print only net new text without any repeats
-            print("---")
-            for segment in newState.confirmedSegments {
-                print("Confirmed segment: \(segment.text)")
-            }
-            for segment in newState.unconfirmedSegments {
-                print("Unconfirmed segment: \(segment.text)")
-            }
-            print("Current text: \(newState.currentText)")
+            // Build the whole update first so it is written to stdout in a single call
+            var lines = ["---"]
+            lines.append(contentsOf: newState.confirmedSegments.map { "Confirmed segment: \($0.text)" })
+            lines.append(contentsOf: newState.unconfirmedSegments.map { "Unconfirmed segment: \($0.text)" })
+            lines.append("Current text: \(newState.currentText)")
+            print(lines.joined(separator: "\n"))
         }
         print("Transcribing audio stream, press Ctrl+C to stop.")
         try await audioStreamTranscriber.startStreamTranscription()
@@ -344,7 +343,8 @@ struct TranscribeCLI: AsyncParsableCommand {
             firstTokenLogProbThreshold: cliArguments.firstTokenLogProbThreshold,
             noSpeechThreshold: cliArguments.noSpeechThreshold ?? 0.6,
             concurrentWorkerCount: cliArguments.concurrentWorkerCount,
-            chunkingStrategy: chunkingStrategy
+            chunkingStrategy: chunkingStrategy,
+            scheduleLongestFirst: cliArguments.lptOrder
         )
     }
 
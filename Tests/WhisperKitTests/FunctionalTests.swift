@@ -223,6 +223,49 @@ final class FunctionalTests: XCTestCase {
         )
     }
 
+    func testBatchTranscribeAudioArraysWithWorkerLimit() async throws {
+        // Shortest clip first, so scheduling longest audio first reorders the inputs
+        let audioPaths = try [
+            XCTUnwrap(
+                Bundle.module.path(forResource: "ja_test_clip", ofType: "wav"),
+                "Audio file not found"
+            ),
+            XCTUnwrap(
+                Bundle.module.path(forResource: "jfk", ofType: "wav"),
+                "Audio file not found"
+            ),
+            XCTUnwrap(
+                Bundle.module.path(forResource: "es_test_clip", ofType: "wav"),
+                "Audio file not found"
+            ),
+        ]
+        let audioArrays = try audioPaths
+            .map { try AudioProcessor.loadAudio(fromPath: $0) }
+            .map { AudioProcessor.convertBufferToArray(buffer: $0) }
+
+        let whisperKit = try await WhisperKit(modelFolder: tinyModelPath())
+        let options = DecodingOptions(concurrentWorkerCount: 2, scheduleLongestFirst: true)
+        let transcriptionResults: [Result<[TranscriptionResult], Swift.Error>] = await whisperKit.transcribeWithResults(
+            audioArrays: audioArrays,
+            decodeOptions: options
+        )
+
+        XCTAssertEqual(transcriptionResults.count, 3)
+        XCTAssertTrue(transcriptionResults.allSatisfy { $0.isSuccess })
+        XCTAssertEqual(
+            try transcriptionResults[0].normalizedText(prefix: 1),
+            "tokyo"
+        )
+        XCTAssertEqual(
+            try transcriptionResults[1].normalizedText(prefix: 5),
+            "and so my fellow americans"
+        )
+        XCTAssertEqual(
+            try transcriptionResults[2].normalizedText(prefix: 2),
+            "this is"
+        )
+    }
+
     func testModelSearchPathLarge() async throws {
         let audioFilePath = try XCTUnwrap(
             Bundle.module.path(forResource: "jfk", ofType: "wav"),
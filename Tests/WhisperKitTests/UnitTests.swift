@@ -489,6 +489,42 @@ final class UnitTests: XCTestCase {
         }
     }
 
+    func testSampleLengthPerInputWithWorkerLimit() async throws {
+        // Shortest clip first, so scheduling longest audio first reorders the inputs
+        let audioArrays = try ["ja_test_clip", "jfk", "es_test_clip"].map { resource in
+            let audioPath = try XCTUnwrap(
+                Bundle.module.path(forResource: resource, ofType: "wav"),
+                "Audio file not found"
+            )
+            return try AudioProcessor.convertBufferToArray(buffer: AudioProcessor.loadAudio(fromPath: audioPath))
+        }
+
+        let whisperKit = try await WhisperKit(modelFolder: tinyModelPath())
+
+        for scheduleLongestFirst in [false, true] {
+            // Each sample length yields a distinct token count, so options applied to the wrong input change the result
+            let decodeOptionsArray: [DecodingOptions?] = [2, 3, 5].map { sampleLength in
+                DecodingOptions(
+                    sampleLength: sampleLength,
+                    usePrefillPrompt: false,
+                    skipSpecialTokens: false,
+                    concurrentWorkerCount: 2,
+                    scheduleLongestFirst: scheduleLongestFirst
+                )
+            }
+
+            let transcriptionResults: [Result<[TranscriptionResult], Swift.Error>] = await whisperKit.transcribeWithOptions(
+                audioArrays: audioArrays,
+                decodeOptionsArray: decodeOptionsArray
+            )
+
+            XCTAssertEqual(transcriptionResults.count, 3)
+            XCTAssertEqual(try transcriptionResults[0].get().first?.segments.first?.tokens.count, 4)
+            XCTAssertEqual(try transcriptionResults[1].get().first?.segments.first?.tokens.count, 5)
+            XCTAssertEqual(try transcriptionResults[2].get().first?.segments.first?.tokens.count, 7)
+        }
+    }
+
     /// Multilingual Tests
     /// NOTE: These are purely for consistency checks and do not reflect the ground truth translations
     func testTranslateSpanish() async throws {
@@ -856,6 +892,14 @@ final class UnitTests: XCTestCase {
         XCTAssertEqual("endoftext|>".trimmingSpecialTokenCharacters(), "endoftext")
     }
 
+    func testStringNormalized() {
+        XCTAssertEqual("Hello, World!".normalized, "hello world")
+        XCTAssertEqual("  Ask not what your country can do \n".normalized, "ask not what your country can do")
+        XCTAssertEqual("Well -- that's   it.".normalized, "well thats it")
+        XCTAssertEqual("one-two".normalized, "one two")
+        XCTAssertEqual("".normalized, "")
+    }
+
     // MARK: - LogitsFilter Tests
 
     func testSuppressTokensFilter() throws {